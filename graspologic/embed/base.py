@@ -97,9 +97,13 @@ class BaseSpectralEmbed(BaseEstimator):
 
         self.n_components_ = D.size
         self.singular_values_ = D
-        self.latent_left_ = U @ np.diag(np.sqrt(D))
+        # Scale columns by sqrt(D) via broadcasting; equivalent to
+        # multiplying by np.diag(np.sqrt(D)) without forming the diagonal
+        # matrix or paying for a dense (n x d) @ (d x d) product.
+        root_d = np.sqrt(D)
+        self.latent_left_ = U * root_d
         if not is_almost_symmetric(A):
-            self.latent_right_ = V.T @ np.diag(np.sqrt(D))
+            self.latent_right_ = V.T * root_d
         else:
             self.latent_right_ = None
 
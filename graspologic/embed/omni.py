@@ -5,9 +5,47 @@ import warnings
 
 import numpy as np
 
-from ..utils import import_graph, is_fully_connected
+from ..utils import import_graph, is_almost_symmetric, is_fully_connected
 from .base import BaseEmbedMulti
+from .svd import selectSVD
 from scipy.sparse import isspmatrix_csr
+from scipy.sparse.linalg import LinearOperator
+
+try:
+    from numba import njit, prange
+
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+try:
+    import numexpr as ne
+
+    _HAVE_NUMEXPR = True
+except ImportError:
+    _HAVE_NUMEXPR = False
+
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True)
+    def _omni_fill_numba(G, out):
+        # Fuses the add, scale, and store of every block into one parallel
+        # pass, writing each output element exactly once with no block
+        # temporaries. Blocks are distributed over threads by flat index.
+        m, n, _ = G.shape
+        for k in prange(m * m):
+            i = k // m
+            j = k % m
+            if i == j:
+                # (A_i + A_i) / 2 = A_i, so the diagonal block is a copy
+                for r in range(n):
+                    for c in range(n):
+                        out[i * n + r, i * n + c] = G[i, r, c]
+            else:
+                for r in range(n):
+                    for c in range(n):
+                        out[i * n + r, j * n + c] = 0.5 * (G[i, r, c] + G[j, r, c])
 
 
 def _get_omni_matrix(graphs):
@@ -24,21 +62,165 @@ def _get_omni_matrix(graphs):
     out : 2d-array
         Array of shape (n_vertices * n_graphs, n_vertices * n_graphs)
     """
-    shape = graphs[0].shape
-    n = shape[0]  # number of vertices
-    m = len(graphs)  # number of graphs
+    G = np.array(graphs, copy=False, ndmin=3)
+    m = G.shape[0]  # number of graphs
+    n = G.shape[1]  # number of vertices
+
+    dtype = np.result_type(G.dtype, np.float32)
+    out = np.empty((m * n, m * n), dtype=dtype)
+
+    # When numba is installed, fill with a JIT-compiled parallel kernel.
+    if _HAVE_NUMBA:
+        _omni_fill_numba(np.ascontiguousarray(G, dtype=dtype), out)
+        return out
+
+    # With numexpr, fill one block at a time: the add and scale fuse into
+    # one thread-chunked pass written straight into the output block, the
+    # diagonal blocks (A_i + A_i) / 2 = A_i are plain copies, and only the
+    # upper triangle of blocks is computed since (i, j) and (j, i) match.
+    # numexpr upcasts float32 internally, so this tier is only used for
+    # float64 output.
+    if _HAVE_NUMEXPR and dtype == np.float64:
+        for i in range(m):
+            rows = slice(i * n, (i + 1) * n)
+            Ai = G[i]
+            np.copyto(out[rows, rows], Ai)
+            for j in range(i + 1, m):
+                cols = slice(j * n, (j + 1) * n)
+                ne.evaluate(
+                    "0.5 * (Ai + Aj)",
+                    local_dict={"Ai": Ai, "Aj": G[j]},
+                    out=out[rows, cols],
+                )
+                out[cols, rows] = out[rows, cols]
+        return out
+
+    # Plain NumPy: broadcast straight into a (m, n, m, n) view of the
+    # output. The interleaved axes are already laid out in the final block
+    # order, so no transposed copy or 4d temporary is materialized and the
+    # trailing reshape back to 2d is free.
+    out4 = out.reshape(m, n, m, n)
+    np.add(G[:, :, None, :], G.transpose(1, 0, 2)[None, :, :, :], out=out4)
+    out4 *= 0.5
+
+    return out
+
+
+def _get_omni_matrix_operator(graphs):
+    """
+    Helper function for creating a :class:`scipy.sparse.linalg.LinearOperator`
+    which computes products with the omnibus matrix without materializing it.
+
+    Parameters
+    ----------
+    graphs : list
+        List of array-like with shapes (n_vertices, n_vertices).
+
+    Returns
+    -------
+    out : LinearOperator
+        Operator of shape (n_vertices * n_graphs, n_vertices * n_graphs)
+        computing products with the omnibus matrix.
+    """
+    if isinstance(graphs, (list, tuple)) and any(isspmatrix_csr(g) for g in graphs):
+        return _get_sparse_omni_matrix_operator(graphs)
 
     A = np.array(graphs, copy=False, ndmin=3)
+    m, n, _ = A.shape
+    A_T = A.transpose(0, 2, 1)
+
+    def _matvec(stack, x):
+        # For the omnibus matrix M with M_ij = (A_i + A_j) / 2, block row i
+        # of a product is (M x)_i = (A_i @ sum_j x_j + sum_j A_j @ x_j) / 2.
+        # The two sums are shared across block rows, so a product costs
+        # O(m n^2) instead of the O(m^2 n^2) of a dense multiply.
+        X = x.reshape(m, n, -1)
+        sum_x = X.sum(axis=0)
+        common = np.tensordot(stack, X, axes=([0, 2], [0, 1]))
+        out = 0.5 * (stack @ sum_x + common)
+        return out.reshape((m * n,) + x.shape[1:])
+
+    return LinearOperator(
+        (m * n, m * n),
+        matvec=lambda x: _matvec(A, x),
+        rmatvec=lambda x: _matvec(A_T, x),
+        matmat=lambda x: _matvec(A, x),
+        dtype=A.dtype,
+    )
+
+
+def _get_omni_matrix_jax(graphs):
+    """
+    JAX implementation of :func:`_get_omni_matrix`: the block construction
+    compiles to a single fused XLA kernel and runs on the default jax device
+    (GPU/TPU when one is configured).
+
+    Parameters
+    ----------
+    graphs : list
+        List of array-like with shapes (n_vertices, n_vertices).
 
-    # Do some numpy broadcasting magic.
-    # We do sum in 4d arrays and reduce to 2d array.
-    # Super fast and efficient
-    out = (A[:, :, None, :] + A.transpose(1, 0, 2)[None, :, :, :]).reshape(n * m, -1)
+    Returns
+    -------
+    out : jax array
+        Array of shape (n_vertices * n_graphs, n_vertices * n_graphs), left
+        on the jax device so that jax-based consumers can avoid a host
+        round trip.
+    """
+    # jax is an optional accelerator; import lazily so that simply having
+    # it installed does not slow down importing this package
+    try:
+        import jax
+        import jax.numpy as jnp
+    except ImportError:
+        msg = "backend='jax' requires jax to be installed"
+        raise ImportError(msg)
 
-    # Averaging
-    out /= 2
+    @jax.jit
+    def _build(G):
+        m, n = G.shape[0], G.shape[1]
+        out = G[:, :, None, :] + G.transpose(1, 0, 2)[None, :, :, :]
+        return 0.5 * out.reshape(m * n, m * n)
 
-    return out
+    return _build(jnp.stack([jnp.asarray(g) for g in graphs]))
+
+
+def _get_sparse_omni_matrix_operator(graphs):
+    """
+    Sparse counterpart of :func:`_get_omni_matrix_operator`: the graphs stay
+    in their sparse format and each product costs O(m * nnz) instead of
+    densifying the omnibus matrix.
+
+    Parameters
+    ----------
+    graphs : list
+        List of scipy.sparse matrices with shapes (n_vertices, n_vertices).
+
+    Returns
+    -------
+    out : LinearOperator
+        Operator of shape (n_vertices * n_graphs, n_vertices * n_graphs)
+        computing products with the omnibus matrix.
+    """
+    m = len(graphs)
+    n = graphs[0].shape[0]
+    graphs_T = [g.T for g in graphs]
+
+    def _matvec(mats, x):
+        X = x.reshape(m, n, -1)
+        sum_x = X.sum(axis=0)
+        # sum_j A_j @ x_j is shared by every block row; compute it once
+        common = sum(mats[j] @ X[j] for j in range(m))
+        out = np.stack([0.5 * (mats[i] @ sum_x + common) for i in range(m)])
+        return out.reshape((m * n,) + x.shape[1:])
+
+    return LinearOperator(
+        (m * n, m * n),
+        matvec=lambda x: _matvec(graphs, x),
+        rmatvec=lambda x: _matvec(graphs_T, x),
+        matmat=lambda x: _matvec(graphs, x),
+        dtype=graphs[0].dtype,
+    )
 
 
 class OmnibusEmbed(BaseEmbedMulti):
@@ -97,6 +279,27 @@ class OmnibusEmbed(BaseEmbedMulti):
         If graph(s) are directed, whether to concatenate each graph's left and right (out and in) latent positions
         along axis 1.
 
+    structured : bool, optional (default False)
+        If True, the omnibus matrix is never materialized; the embedding is
+        computed from matrix-vector products with its block structure, which
+        reduces memory from :math:`O((mn)^2)` to :math:`O(mnd)`. Only the
+        truncated SVD solver can consume the implicit operator, so
+        ``algorithm`` is ignored.
+
+    dtype : np.float64 (default) or np.float32
+        Floating point precision used for the omnibus matrix and the SVD.
+        float32 halves the memory footprint and memory bandwidth of the
+        embedding at the cost of numerical tolerance, roughly 1e-6 to 1e-3
+        in the latent positions.
+
+    backend : {'numpy' (default), 'jax'}
+        Which array library builds the omnibus matrix. 'jax' compiles the
+        block construction to a single fused XLA kernel on the default jax
+        device (GPU/TPU when configured) before embedding on the host.
+        Requires jax and cannot be combined with ``structured`` or sparse
+        input, which never materialize the matrix. Note jax computes in
+        float32 unless its x64 mode is enabled, regardless of ``dtype``.
+
     Attributes
     ----------
     n_graphs_ : int
@@ -139,6 +342,9 @@ class OmnibusEmbed(BaseEmbedMulti):
         check_lcc=True,
         diag_aug=True,
         concat=False,
+        structured=False,
+        dtype=np.float64,
+        backend="numpy",
     ):
         super().__init__(
             n_components=n_components,
@@ -150,31 +356,78 @@ class OmnibusEmbed(BaseEmbedMulti):
             concat=concat,
         )
 
+        if not isinstance(structured, bool):
+            raise TypeError("`structured` must be of type bool")
+        self.structured = structured
+
+        dtype = np.dtype(dtype)
+        if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            msg = "`dtype` must be np.float32 or np.float64, not {}.".format(dtype)
+            raise ValueError(msg)
+        self.dtype = dtype
+
+        if backend not in ("numpy", "jax"):
+            msg = "`backend` must be 'numpy' or 'jax', not {}.".format(backend)
+            raise ValueError(msg)
+        if backend == "jax" and structured:
+            msg = "`backend='jax'` cannot be combined with `structured`"
+            raise ValueError(msg)
+        self.backend = backend
+
     def fit(self, graphs, y=None):
         """
         Fit the model with graphs.
 
         Parameters
         ----------
-        graphs : list of nx.Graph or ndarray, or ndarray
+        graphs : list of nx.Graph, ndarray or scipy.sparse.csr_matrix, or ndarray
             If list of nx.Graph, each Graph must contain same number of nodes.
             If list of ndarray, each array must have shape (n_vertices, n_vertices).
             If ndarray, then array must have shape (n_graphs, n_vertices, n_vertices).
+            If list of csr_matrix, the graphs stay sparse and are embedded
+            through the implicit omnibus operator as with ``structured``.
 
         Returns
         -------
         self : object
             Returns an instance of self.
         """
-        if any([isspmatrix_csr(g) for g in graphs]):
-            msg = "OmnibusEmbed does not support scipy.sparse.csr_matrix inputs"
+        # Sparse graphs stay in their sparse format and are embedded through
+        # the implicit operator; materializing the omnibus matrix would
+        # densify them.
+        sparse_input = any(isspmatrix_csr(g) for g in graphs)
+        if sparse_input and not all(isspmatrix_csr(g) for g in graphs):
+            msg = "Input graphs must be all dense or all scipy.sparse.csr_matrix"
             raise TypeError(msg)
+        if sparse_input and self.backend == "jax":
+            msg = "`backend='jax'` cannot be combined with sparse input"
+            raise ValueError(msg)
 
         graphs = self._check_input_graphs(graphs)
 
+        if sparse_input:
+            graphs = [
+                g if g.dtype == self.dtype else g.astype(self.dtype) for g in graphs
+            ]
+        else:
+            # Stack list input into a single (m, n, n) tensor up front so
+            # every downstream pass (connectedness check, diagonal
+            # augmentation, omnibus construction) operates on one contiguous
+            # array instead of converting or dispatching per graph. Cast at
+            # the same time so the omnibus construction and the SVD both run
+            # at the requested precision; no copy is made when the stack is
+            # already contiguous at that dtype.
+            if isinstance(graphs, list):
+                graphs = np.stack(graphs)
+            graphs = np.ascontiguousarray(graphs, dtype=self.dtype)
+
         # Check if Abar is connected
         if self.check_lcc:
-            if not is_fully_connected(np.mean(graphs, axis=0)):
+            if sparse_input:
+                abar = sum(graphs) / len(graphs)
+            else:
+                abar = np.mean(graphs, axis=0)
+            if not is_fully_connected(abar):
                 msg = (
                     "Input graphs are not fully connected. Results may not"
                     + "be optimal. You can compute the largest connected component by"
@@ -186,11 +439,38 @@ class OmnibusEmbed(BaseEmbedMulti):
         if self.diag_aug:
             graphs = self._diag_aug(graphs)
 
-        # Create omni matrix
-        omni_matrix = _get_omni_matrix(graphs)
-
-        # Embed
-        self._reduce_dim(omni_matrix)
+        # Create omni matrix and embed
+        if self.structured or sparse_input:
+            # Embed through products with the implicit operator rather than
+            # the materialized matrix. Only the truncated SVD solver can
+            # consume a LinearOperator.
+            omni_matrix = _get_omni_matrix_operator(graphs)
+            U, D, V = selectSVD(
+                omni_matrix,
+                n_components=self.n_components,
+                n_elbows=self.n_elbows,
+                algorithm="truncated",
+                n_iter=self.n_iter,
+            )
+            self.n_components_ = D.size
+            self.singular_values_ = D
+            root_d = np.sqrt(D)
+            self.latent_left_ = U * root_d
+            # The omnibus matrix is symmetric exactly when every input graph
+            # is, so check the inputs instead of forming the matrix.
+            if all(is_almost_symmetric(g) for g in graphs):
+                self.latent_right_ = None
+            else:
+                self.latent_right_ = V.T * root_d
+        else:
+            if self.backend == "jax":
+                # the host copy hands the XLA-built matrix to the scipy and
+                # sklearn solvers; a fully on-device pipeline would need the
+                # SVD in jax as well
+                omni_matrix = np.asarray(_get_omni_matrix_jax(graphs))
+            else:
+                omni_matrix = _get_omni_matrix(graphs)
+            self._reduce_dim(omni_matrix)
 
         # Reshape to tensor
         self.latent_left_ = self.latent_left_.reshape(
@@ -6,6 +6,7 @@ import scipy
 import sklearn
 from scipy.stats import norm
 from scipy.sparse import isspmatrix_csr
+from scipy.sparse.linalg import LinearOperator
 
 
 def _compute_likelihood(arr):
@@ -93,9 +94,10 @@ def select_dimension(
         pp.918-930.
     """
     # Handle input data
-    if not isinstance(X, np.ndarray) and not isspmatrix_csr(X):
-        msg = "X must be a numpy array or scipy.sparse.csr_matrix, not {}.".format(
-            type(X)
+    if not isinstance(X, (np.ndarray, LinearOperator)) and not isspmatrix_csr(X):
+        msg = (
+            "X must be a numpy array, scipy.sparse.csr_matrix, or "
+            "LinearOperator, not {}.".format(type(X))
         )
         raise ValueError(msg)
     if X.ndim > 2:
@@ -7,6 +7,11 @@ from sklearn.utils import check_array, column_or_1d
 
 from .qap import quadratic_assignment
 
+try:
+    from scipy.optimize import quadratic_assignment as _scipy_quadratic_assignment
+except ImportError:  # pre-1.6 scipy without quadratic_assignment
+    _scipy_quadratic_assignment = None
+
 
 class GraphMatch(BaseEstimator):
     """
@@ -85,6 +90,24 @@ class GraphMatch(BaseEstimator):
         instance, then that object is used.
         Default is None.
 
+    backend : string (default = 'graspologic')
+        Which FAQ implementation solves the problem.
+
+        "graspologic" : the implementation in :mod:`graspologic.match`.
+
+        "scipy" : :func:`scipy.optimize.quadratic_assignment` with
+        ``method='faq'``, the upstream-maintained version of the same
+        algorithm. Requires scipy >= 1.6 and does not support the
+        similarity term ``S``. scipy interprets a 2d-array ``init``
+        relative to the shuffled node order, so a custom ``init`` is run
+        with ``shuffle_input`` disabled to keep the semantics above.
+
+    device : None or str (default = None)
+        If given, a torch device string (e.g. ``"cpu"``, ``"cuda"``) on
+        which the Frank-Wolfe gradient products are computed; the linear
+        sum assignment step stays on the CPU. Requires torch and the
+        "graspologic" backend. None keeps everything in NumPy.
+
     Attributes
     ----------
 
@@ -126,6 +149,8 @@ class GraphMatch(BaseEstimator):
         gmp=True,
         padding="adopted",
         random_state=None,
+        backend="graspologic",
+        device=None,
     ):
         if type(n_init) is int and n_init > 0:
             self.n_init = n_init
@@ -169,6 +194,25 @@ class GraphMatch(BaseEstimator):
         else:
             msg = '"padding" parameter must be of type string'
             raise TypeError(msg)
+        if isinstance(backend, str) and backend in {"graspologic", "scipy"}:
+            if backend == "scipy" and _scipy_quadratic_assignment is None:
+                msg = '"scipy" backend requires scipy >= 1.6'
+                raise ImportError(msg)
+            self.backend = backend
+        elif isinstance(backend, str):
+            msg = 'Invalid "backend" parameter string'
+            raise ValueError(msg)
+        else:
+            msg = '"backend" parameter must be of type string'
+            raise TypeError(msg)
+        if device is None or isinstance(device, str):
+            if device is not None and self.backend != "graspologic":
+                msg = '"device" is only supported by the "graspologic" backend'
+                raise ValueError(msg)
+            self.device = device
+        else:
+            msg = '"device" parameter must be None or of type string'
+            raise TypeError(msg)
         self.random_state = random_state
 
     def fit(self, A, B, seeds_A=[], seeds_B=[], S=None):
@@ -227,7 +271,6 @@ class GraphMatch(BaseEstimator):
         options = {
             "maximize": self.gmp,
             "partial_match": partial_match,
-            "S": S,
             "rng": self.random_state,
             "P0": self.init,
             "shuffle_input": self.shuffle_input,
@@ -235,8 +278,27 @@ class GraphMatch(BaseEstimator):
             "tol": self.eps,
         }
 
-        res = min(
-            [quadratic_assignment(A, B, options=options) for i in range(self.n_init)],
+        if self.backend == "scipy":
+            # scipy's faq solver has no similarity term
+            if np.any(S):
+                msg = '"scipy" backend does not support the similarity matrix `S`'
+                raise ValueError(msg)
+            # scipy applies a 2d-array P0 relative to the shuffled node
+            # order rather than the input order, so only shuffle for the
+            # string initializations
+            if isinstance(self.init, np.ndarray):
+                options["shuffle_input"] = False
+            solver = _scipy_quadratic_assignment
+        else:
+            options["S"] = S
+            options["device"] = self.device
+            solver = quadratic_assignment
+
+        # keep the best restart with respect to the objective direction:
+        # highest objective when maximizing (gmp), lowest otherwise
+        best = max if self.gmp else min
+        res = best(
+            [solver(A, B, options=options) for i in range(self.n_init)],
             key=lambda x: x.fun,
         )
 
@@ -222,6 +222,7 @@ def _quadratic_assignment_faq(
     shuffle_input=False,
     maxiter=30,
     tol=0.03,
+    device=None,
 ):
     r"""
     Solve the quadratic assignment problem (approximately).
@@ -313,6 +314,11 @@ def _quadratic_assignment_faq(
         iterations is sufficiently small, that is, when the relative Frobenius
         norm, :math:`\frac{||P_{i}-P_{i+1}||_F}{\sqrt{len(P_{i})}} \leq tol`,
         where :math:`i` is the iteration number.
+    device : None or str (default = None)
+        If given, a torch device string (e.g. ``"cpu"``, ``"cuda"``) on
+        which the gradient matrix products of each Frank-Wolfe iteration
+        are computed. The linear sum assignment step stays on the CPU via
+        scipy. Requires torch; None keeps everything in NumPy.
     Returns
     -------
     res : OptimizeResult
@@ -374,6 +380,15 @@ def _quadratic_assignment_faq(
 
     maxiter = operator.index(maxiter)
 
+    # torch is an optional accelerator; import lazily so that simply having
+    # it installed does not slow down importing this package
+    if device is not None:
+        try:
+            import torch
+        except ImportError:
+            msg = "`device` requires torch to be installed"
+            raise ImportError(msg)
+
     # ValueError check
     A, B, partial_match = _common_input_validation(A, B, partial_match)
 
@@ -451,10 +466,23 @@ def _quadratic_assignment_faq(
 
     const_sum = A21 @ B21.T + A12.T @ B12 + S22
 
+    # The gradient GEMMs dominate each iteration; optionally run them on a
+    # torch device, keeping the linear sum assignment on the CPU.
+    # P is always float64, and unlike NumPy, torch does not promote
+    # integer adjacency matrices in a mixed-dtype product.
+    if device is not None:
+        A22_t = torch.as_tensor(A22, device=device, dtype=torch.float64)
+        B22_t = torch.as_tensor(B22, device=device, dtype=torch.float64)
+
     # [1] Algorithm 1 Line 2 - loop while stopping criteria not met
     for n_iter in range(1, maxiter + 1):
         # [1] Algorithm 1 Line 3 - compute the gradient of f(P) = -tr(APB^tP^t)
-        grad_fp = const_sum + A22 @ P @ B22.T + A22.T @ P @ B22
+        if device is not None:
+            P_t = torch.as_tensor(P, device=device, dtype=torch.float64)
+            grad_t = A22_t @ P_t @ B22_t.t() + A22_t.t() @ P_t @ B22_t
+            grad_fp = const_sum + grad_t.cpu().numpy()
+        else:
+            grad_fp = const_sum + A22 @ P @ B22.T + A22.T @ P @ B22
         # [1] Algorithm 1 Line 4 - get direction Q by solving Eq. 8
         _, cols = linear_sum_assignment(grad_fp, maximize=maximize)
         Q = np.eye(n_unseed)[cols]
@@ -536,9 +536,13 @@ def multigraph_lcc_union(graphs, return_inds=False):
             raise NotImplementedError
 
         out = [import_graph(g) for g in graphs]
-        if len(set(map(np.shape, out))) != 1:
-            msg = "All input graphs must have the same size"
-            raise ValueError(msg)
+        # Compare each shape against the first directly, exiting on the
+        # first mismatch, rather than hashing every shape into a set.
+        shape = out[0].shape
+        for g in out[1:]:
+            if g.shape != shape:
+                msg = "All input graphs must have the same size"
+                raise ValueError(msg)
         bar = np.stack(out).mean(axis=0)
     elif isinstance(graphs, np.ndarray):
         shape = graphs.shape
@@ -6,8 +6,14 @@ import pytest
 from numpy import allclose, array_equal
 from numpy.linalg import norm
 from numpy.testing import assert_allclose
-
-from graspologic.embed.omni import OmnibusEmbed, _get_omni_matrix
+from scipy.sparse import csr_matrix
+
+from graspologic.embed.omni import (
+    OmnibusEmbed,
+    _get_omni_matrix,
+    _get_omni_matrix_jax,
+    _get_omni_matrix_operator,
+)
 from graspologic.simulations.simulations import er_nm, er_np, sbm
 from graspologic.utils.utils import is_symmetric, symmetrize
 
@@ -75,6 +81,126 @@ def test_omni_matrix_random():
     assert_allclose(A, expected_output)
 
 
+@pytest.mark.parametrize("tier", ["numba", "numexpr", "numpy"])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_omni_matrix_fill_tiers(monkeypatch, tier, dtype):
+    # _get_omni_matrix dispatches to numba, then numexpr, then plain NumPy;
+    # force each tier so all three stay exercised regardless of which
+    # optional libraries the environment happens to have
+    import graspologic.embed.omni as omni_module
+
+    if tier == "numba" and not omni_module._HAVE_NUMBA:
+        pytest.skip("numba is not installed")
+    if tier == "numexpr" and not omni_module._HAVE_NUMEXPR:
+        pytest.skip("numexpr is not installed")
+    monkeypatch.setattr(omni_module, "_HAVE_NUMBA", tier == "numba")
+    monkeypatch.setattr(omni_module, "_HAVE_NUMEXPR", tier == "numexpr")
+
+    np.random.seed(14)
+    n = 15
+    m = 3
+    symmetric = [er_np(n, 0.4).astype(dtype) for _ in range(m)]
+    directed = [(10 * np.random.rand(n, n)).astype(dtype) for _ in range(m)]
+
+    for graphs in (symmetric, directed):
+        expected = np.block(
+            [[0.5 * (graphs[i] + graphs[j]) for j in range(m)] for i in range(m)]
+        )
+        out = _get_omni_matrix(graphs)
+        assert out.dtype == np.result_type(dtype, np.float32)
+        assert_allclose(out, expected)
+
+
+def test_omni_matrix_operator():
+    # products with the implicit operator should match products with the
+    # materialized omnibus matrix
+    np.random.seed(2)
+    n = 20
+    graphs = [er_np(n, 0.4) for _ in range(3)]
+    dense = _get_omni_matrix(graphs)
+    operator = _get_omni_matrix_operator(graphs)
+
+    x = np.random.rand(3 * n)
+    X = np.random.rand(3 * n, 4)
+    assert_allclose(operator.matvec(x), dense @ x)
+    assert_allclose(operator.rmatvec(x), dense.T @ x)
+    assert_allclose(operator.matmat(X), dense @ X)
+
+    # directed graphs, where matvec and rmatvec differ
+    graphs = [np.random.rand(n, n) for _ in range(2)]
+    dense = _get_omni_matrix(graphs)
+    operator = _get_omni_matrix_operator(graphs)
+
+    x = np.random.rand(2 * n)
+    assert_allclose(operator.matvec(x), dense @ x)
+    assert_allclose(operator.rmatvec(x), dense.T @ x)
+
+
+def test_omni_embed_structured():
+    # the structured embedding should span the same subspace as embedding
+    # the materialized omnibus matrix
+    np.random.seed(8)
+    n = 50
+    graphs = [er_np(n, 0.3) for _ in range(3)]
+
+    dense = OmnibusEmbed(n_components=2, algorithm="truncated").fit_transform(graphs)
+    structured = OmnibusEmbed(n_components=2, structured=True).fit_transform(graphs)
+
+    assert structured.shape == dense.shape
+    dense = dense.reshape(3 * n, -1)
+    structured = structured.reshape(3 * n, -1)
+    assert_allclose(structured @ structured.T, dense @ dense.T, atol=1e-6)
+
+
+def test_omni_backend_validation():
+    with pytest.raises(ValueError):
+        OmnibusEmbed(backend="cupy")
+
+    with pytest.raises(ValueError):
+        OmnibusEmbed(backend="jax", structured=True)
+
+    # sparse input never materializes the omnibus matrix, so the jax
+    # backend cannot apply to it
+    with pytest.raises(ValueError):
+        graphs = [csr_matrix(np.eye(5)) for _ in range(2)]
+        OmnibusEmbed(n_components=2, backend="jax").fit(graphs)
+
+
+def test_omni_matrix_jax():
+    pytest.importorskip("jax")
+    np.random.seed(15)
+    graphs = [er_np(20, 0.4) for _ in range(3)]
+
+    expected = _get_omni_matrix(graphs)
+    out = np.asarray(_get_omni_matrix_jax(graphs))
+
+    # jax computes in float32 unless its x64 mode is enabled
+    assert_allclose(out, expected, atol=1e-6)
+
+
+def test_omni_embed_sparse():
+    # sparse graphs embed through the implicit operator and should span the
+    # same subspace as the dense embedding
+    np.random.seed(12)
+    n = 50
+    dense_graphs = [er_np(n, 0.3) for _ in range(3)]
+    sparse_graphs = [csr_matrix(g) for g in dense_graphs]
+
+    dense = OmnibusEmbed(n_components=2, algorithm="truncated").fit_transform(
+        dense_graphs
+    )
+    sparse = OmnibusEmbed(n_components=2).fit_transform(sparse_graphs)
+
+    assert sparse.shape == dense.shape
+    dense = dense.reshape(3 * n, -1)
+    sparse = sparse.reshape(3 * n, -1)
+    assert_allclose(sparse @ sparse.T, dense @ dense.T, atol=1e-6)
+
+    # mixed sparse and dense input is rejected
+    with pytest.raises(TypeError):
+        OmnibusEmbed().fit([sparse_graphs[0], dense_graphs[1]])
+
+
 def test_invalid_inputs():
     with pytest.raises(TypeError):
         wrong_diag_aug = "True"
@@ -95,6 +221,24 @@ def test_invalid_inputs():
         omni = OmnibusEmbed(n_components=2)
         omni.fit(wrong_dtypes)
 
+    with pytest.raises(ValueError):
+        omni = OmnibusEmbed(dtype=np.int64)
+
+
+def test_omni_embed_float32():
+    np.random.seed(10)
+    n = 60
+    graphs = [er_np(n, 0.3) for _ in range(2)]
+
+    emb64 = OmnibusEmbed(n_components=2, algorithm="truncated").fit_transform(graphs)
+    emb32 = OmnibusEmbed(
+        n_components=2, algorithm="truncated", dtype=np.float32
+    ).fit_transform(graphs)
+
+    assert emb32.dtype == np.float32
+    # sign flips between solves leave row norms unchanged
+    assert_allclose(norm(emb32, axis=2), norm(emb64, axis=2), atol=1e-3)
+
 
 def test_omni_matrix_symmetric():
     np.random.seed(3)